@@ -0,0 +1,98 @@
+"""startup time benchmark.
+
+python bench_startup.py            # against a fake local bot api, no token needed
+python bench_startup.py --connect  # also against the real apis, needs TOKEN in .env
+
+exits with 1 if the median full startup is over BUDGET seconds.
+"""
+import asyncio
+import statistics
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent
+RUNS = 5
+BUDGET = 5.0  # seconds, import main + init_bot
+
+# must match bot_init._apis
+FAKE_API_HOST = 'localhost'
+FAKE_API_PORT = 8081
+FAKE_TOKEN = '123456:bench'
+
+IMPORTS = """
+import asyncio
+import main
+import bot_init
+"""
+
+INIT_BOT = """
+async def start():
+    bot, _ = await bot_init.init_bot()
+    await bot.session.close()
+
+asyncio.run(start())
+"""
+
+
+def run_timed(code: str, setup: str = '') -> float:
+    """run code in a fresh interpreter from the repo root, so nothing is cached"""
+    script = f"{setup}\nimport time\n_t = time.perf_counter()\n{code}\nprint(time.perf_counter() - _t)"
+    out = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                         check=True, capture_output=True, text=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+async def _fake_api(request: web.Request) -> web.Response:
+    if request.path.endswith('/getMe'):
+        return web.json_response({'ok': True, 'result': {
+            'id': 123456, 'is_bot': True, 'first_name': 'bench', 'username': 'bench_bot'
+        }})
+    # the local api answers 404 on its root, that's what bot_init probes for
+    return web.Response(status=404)
+
+
+def start_fake_api():
+    """serve a minimal local bot api in a background thread"""
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', _fake_api)
+    runner = web.AppRunner(app, access_log=None)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, FAKE_API_HOST, FAKE_API_PORT).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+
+def report(name: str, samples: list[float]) -> float:
+    median = statistics.median(samples)
+    print(f"{name}: median {median * 1000:.0f}ms, "
+          f"min {min(samples) * 1000:.0f}ms, max {max(samples) * 1000:.0f}ms "
+          f"({len(samples)} runs)")
+    return median
+
+
+def main():
+    report('import aiogram', [run_timed('import aiogram') for _ in range(RUNS)])
+    report('import main', [run_timed('import main') for _ in range(RUNS)])
+
+    if '--connect' in sys.argv:
+        name, token = 'real apis', ''
+    else:
+        start_fake_api()
+        name, token = 'fake local api', f"bot_init._env['TOKEN'] = {FAKE_TOKEN!r}"
+
+    report(f'init_bot, {name}', [run_timed(INIT_BOT, setup=IMPORTS + token)
+                                 for _ in range(RUNS)])
+    startup = report(f'full startup, {name}', [run_timed(IMPORTS + token + INIT_BOT)
+                                               for _ in range(RUNS)])
+
+    if startup > BUDGET:
+        print(f"over budget: {startup:.2f}s > {BUDGET:.2f}s")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
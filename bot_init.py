@@ -1,3 +1,4 @@
+import asyncio
 import aiohttp
 import logging
 from aiogram import Bot, Dispatcher
@@ -46,42 +47,48 @@ log.addHandler(handler)
 _env = dotenv_values('.env')
 using_local_api: bool = False
 max_file_size: int = 50 * 1024 * 1024
+_probe_timeout: float = 2  # seconds, local apis answer right away or not at all
 
 
-async def _get_session() -> AiohttpSession:
-    global using_local_api
-    async with aiohttp.ClientSession() as client_session:
-        for api in _apis:
-            log.info(f"trying {api}")
-            try:
-                async with client_session.get(f"{api}", timeout=10) as resp:
-                    if resp.status == 404:
-                        server = TelegramAPIServer.from_base(api)
-                        session = AiohttpSession(api=server)
-                        log.info(f"using {api}")
-                        using_local_api = True
-                        return session
-            except Exception as e:
-                log.warning(f'{e}')
-            log.warning(f"{api} unavailable")
-    log.warning("local api unavailable, falling back to default")
+async def _probe_api(client_session: aiohttp.ClientSession, api: str) -> str | None:
+    log.info(f"trying {api}")
     try:
-        server = TelegramAPIServer.from_base('https://api.telegram.org')
-        session = AiohttpSession(api=server)
-        return session
+        timeout = aiohttp.ClientTimeout(total=_probe_timeout)
+        async with client_session.get(f"{api}", timeout=timeout) as resp:
+            if resp.status == 404:
+                return api
     except Exception as e:
-        log.error(f'{e}')
-        log.critical('no apis available, exiting')
-        exit()
+        log.warning(f'{e}')
+    log.warning(f"{api} unavailable")
+    return None
+
+
+async def _find_local_api(client_session: aiohttp.ClientSession) -> str | None:
+    """probe all local apis at once, first one in _apis that answers wins"""
+    results = await asyncio.gather(*(_probe_api(client_session, api) for api in _apis))
+    return next((api for api in results if api), None)
 
 
 async def init_bot() -> tuple[Bot, Dispatcher]:
-    global max_file_size
-    session = await _get_session()
+    global max_file_size, using_local_api
+    # probe through the bot's own session, so if a local api wins
+    # the connection opened while probing is reused for getMe and polling
+    session = AiohttpSession(api=TelegramAPIServer.from_base('https://api.telegram.org'))
+    client_session = await session.create_session()
+
+    # probe before any other request: a bot running on a local api must not
+    # touch the cloud one, or it gets logged back in there
+    if local_api := await _find_local_api(client_session):
+        session.api = TelegramAPIServer.from_base(local_api)
+        using_local_api = True
+        log.info(f"using {local_api}")
+    else:
+        log.warning("local api unavailable, falling back to default")
+
     max_file_size = (2000 if using_local_api else 50) * 1024 * 1024
     # 2gb if local, 50mb otherwise
     bot = Bot(token=_env["TOKEN"], session=session)
     my_user = await bot.get_me()
     log.info(f'connected as @{my_user.username}')
     dp = Dispatcher(bot=bot)
-    return bot, dp
\ No newline at end of file
+    return bot, dp